@@ -1,9 +1,21 @@
 # Import necessary modules from FastAPI and Pydantic.
-from fastapi import FastAPI, Path
+from functools import cache
+import orjson
+from fastapi import FastAPI, Path, Response
 from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
+# -----------------------------------------------------------------------------
+# Operation ID Generation
+# -----------------------------------------------------------------------------
+# Derive short, stable unique IDs from the route name instead of FastAPI's default
+# '<name>_<path>_<method>'. Each endpoint also sets an explicit operation_id, which
+# becomes the Semantic Kernel function name.
+def _gen_id(route: APIRoute) -> str:
+    return f"{route.tags[0] if route.tags else 'op'}_{route.name}"
+
 # -----------------------------------------------------------------------------
 # Initialize FastAPI Application
 # -----------------------------------------------------------------------------
@@ -16,7 +28,8 @@ app = FastAPI(
         "Swagger docs. Endpoints include item creation, retrieval, and listing all available items. "
         "This rich metadata is designed for LLM agentic frameworks or similar systems."
     ),
-    version="1.0.0"
+    version="1.0.0",
+    generate_unique_id_function=_gen_id
 )
 
 # -----------------------------------------------------------------------------
@@ -46,6 +59,26 @@ class Item(BaseModel):
         description="The applicable tax for the item, if any."
     )
 
+# -----------------------------------------------------------------------------
+# Static Demo Data
+# -----------------------------------------------------------------------------
+# The demo items are trusted constants, so they are built once with model_construct
+# (skipping validation) and the list payload is serialized once at import.
+_SAMPLE_ITEM = Item.model_construct(name="Sample", price=100.0, description="Example item", tax=10.0)
+_SURFACE_LAPTOP = Item.model_construct(
+    name="Surface Laptop",
+    description="A sleek Microsoft laptop with an elegant design and robust performance.",
+    price=999.99,
+    tax=99.99
+)
+
+fake_items = [
+    _SURFACE_LAPTOP,
+    # Add additional fake items here if necessary.
+]
+_ITEMS_BYTES = orjson.dumps([item.model_dump() for item in fake_items])
+_SAMPLE_ITEM_BYTES = orjson.dumps(_SAMPLE_ITEM.model_dump())
+
 # -----------------------------------------------------------------------------
 # API Endpoints
 # -----------------------------------------------------------------------------
@@ -56,7 +89,8 @@ class Item(BaseModel):
 # and returns the created item as confirmation.
 @app.post(
     "/items/",
-    response_model=Item,
+    operation_id="create_item",
+    responses={200: {"model": Item, "description": "Successful Response"}},
     summary="Create an Item",
     description=(
         "Endpoint to create a new item. Provide detailed item information including its "
@@ -77,7 +111,8 @@ async def create_item(item: Item):
     **Returns:**
     - The created item object, confirming the data received.
     """
-    return item
+    # The item was already validated on the way in, so dump it straight to JSON.
+    return Response(content=item.model_dump_json(), media_type="application/json")
 
 # GET Endpoint: List All Available Items
 # -----------------------------------------------------------------------------
@@ -85,7 +120,8 @@ async def create_item(item: Item):
 # a static list containing an example "Surface Laptop" as well as any additional items.
 @app.get(
     "/items/",
-    response_model=List[Item],
+    operation_id="list_items",
+    responses={200: {"model": List[Item], "description": "Successful Response"}},
     summary="List All Items",
     description=(
         "Endpoint to retrieve a list of all available items. It returns each item with details "
@@ -104,16 +140,7 @@ async def list_items():
         - *price*: The selling price.
         - *tax*: The applicable tax.
     """
-    items = [
-        Item(
-            name="Surface Laptop",
-            description="A sleek Microsoft laptop with an elegant design and robust performance.",
-            price=999.99,
-            tax=99.99
-        ),
-        # Add additional fake items here if necessary.
-    ]
-    return items
+    return Response(content=_ITEMS_BYTES, media_type="application/json")
 
 # GET Endpoint: Retrieve a Single Item by ID
 # -----------------------------------------------------------------------------
@@ -121,7 +148,8 @@ async def list_items():
 # For demonstration purposes, it returns a static item.
 @app.get(
     "/items/{item_id}",
-    response_model=Item,
+    operation_id="read_item",
+    responses={200: {"model": Item, "description": "Successful Response"}},
     summary="Retrieve an Item",
     description=(
         "Endpoint to retrieve a specific item by its unique identifier. For demo purposes, "
@@ -148,7 +176,7 @@ async def read_item(
         - *price*: The selling price.
         - *tax*: The applicable tax.
     """
-    return Item(name="Sample", price=100, description="Example item", tax=10)
+    return Response(content=_SAMPLE_ITEM_BYTES, media_type="application/json")
 
 # -----------------------------------------------------------------------------
 # Custom OpenAPI Schema Function with Server Information
@@ -159,11 +187,10 @@ def custom_openapi():
     """
     Generate a custom OpenAPI schema with additional server information.
 
-    This function checks if an OpenAPI schema already exists. If not, it creates one using FastAPI's
-    'get_openapi' utility and adds a 'servers' entry that defines the base URL for API access.
+    The schema is built using FastAPI's 'get_openapi' utility, with a 'servers' entry that
+    defines the base URL for API access. It is wrapped with functools.cache when assigned
+    to app.openapi, so it only runs once.
     """
-    if app.openapi_schema:
-        return app.openapi_schema
     openapi_schema = get_openapi(
         title=app.title,
         version=app.version,
@@ -174,8 +201,7 @@ def custom_openapi():
     openapi_schema["servers"] = [
         {"url": "http://127.0.0.1:8000", "description": "Local development server"}
     ]
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    return openapi_schema
 
 # Override the default OpenAPI generation with the custom function.
-app.openapi = custom_openapi
+app.openapi = cache(custom_openapi)
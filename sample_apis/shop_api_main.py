@@ -1,9 +1,21 @@
 # Import necessary modules from FastAPI and Pydantic.
-from fastapi import FastAPI, HTTPException
+from functools import cache
+import msgspec
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
+# -----------------------------------------------------------------------------
+# Operation ID Generation
+# -----------------------------------------------------------------------------
+# Derive short, stable unique IDs from the route name instead of FastAPI's default
+# '<name>_<path>_<method>'. Each endpoint also sets an explicit operation_id, which
+# becomes the Semantic Kernel function name.
+def _gen_id(route: APIRoute) -> str:
+    return f"{route.tags[0] if route.tags else 'op'}_{route.name}"
+
 # -----------------------------------------------------------------------------
 # Initialize FastAPI Application with Fake Store Metadata
 # -----------------------------------------------------------------------------
@@ -14,7 +26,8 @@ app = FastAPI(
         "list available store items and to purchase a specific item. The detailed "
         "metadata is tailored for LLM agentic orchestration through semantic Swagger docs."
     ),
-    version="1.0.0"
+    version="1.0.0",
+    generate_unique_id_function=_gen_id
 )
 
 # -----------------------------------------------------------------------------
@@ -66,6 +79,38 @@ class PurchaseOrder(BaseModel):
         description="The number of units to purchase. Defaults to 1."
     )
 
+# PurchaseConfirmation: Represents the confirmation returned for a purchase order.
+class PurchaseConfirmation(BaseModel):
+    message: str = Field(
+        ...,
+        title="Confirmation Message",
+        description="A thank-you message addressed to the buyer."
+    )
+    product: StoreItem = Field(
+        ...,
+        title="Purchased Product",
+        description="The details of the purchased product."
+    )
+    quantity: int = Field(
+        ...,
+        title="Quantity",
+        description="The number of units purchased."
+    )
+    total_price: float = Field(
+        ...,
+        title="Total Price",
+        description="The product price plus applicable tax, multiplied by the quantity."
+    )
+
+# StoreItemStruct: Serve-time mirror of StoreItem, encoded by msgspec in a single pass.
+# StoreItem remains the model used for validation and documentation.
+class StoreItemStruct(msgspec.Struct):
+    id: int
+    name: str
+    description: Optional[str]
+    price: float
+    tax: Optional[float]
+
 # -----------------------------------------------------------------------------
 # In-Memory Fake Inventory (Simulated Database)
 # -----------------------------------------------------------------------------
@@ -104,6 +149,13 @@ store_inventory = [
     # Additional fake items can be added here.
 ]
 
+# Index the inventory by product ID once, so purchases are a dictionary lookup.
+_INVENTORY_BY_ID: dict[int, StoreItem] = {item.id: item for item in store_inventory}
+
+# The inventory never changes at runtime, so its JSON payload is serialized once.
+_STRUCT_INVENTORY = [StoreItemStruct(**item.model_dump()) for item in store_inventory]
+_STORE_ITEMS_BYTES = msgspec.json.encode(_STRUCT_INVENTORY)
+
 # -----------------------------------------------------------------------------
 # API Endpoints
 # -----------------------------------------------------------------------------
@@ -111,7 +163,8 @@ store_inventory = [
 # GET Endpoint: List Store Items
 @app.get(
     "/store/items",
-    response_model=List[StoreItem],
+    operation_id="list_store_items",
+    responses={200: {"model": List[StoreItem], "description": "Successful Response"}},
     summary="List Store Items",
     description=(
         "Retrieve a list of all available items in the fake store. "
@@ -130,11 +183,13 @@ async def list_store_items():
       - *price*: The selling price.
       - *tax*: Applicable tax (if any).
     """
-    return store_inventory
+    return Response(content=_STORE_ITEMS_BYTES, media_type="application/json")
 
 # POST Endpoint: Purchase an Item
 @app.post(
     "/store/buy",
+    operation_id="purchase_item",
+    responses={200: {"model": PurchaseConfirmation, "description": "Successful Response"}},
     summary="Purchase an Item",
     description=(
         "Place a purchase order for a specific store item. Provide the product ID, "
@@ -159,20 +214,25 @@ async def purchase_item(order: PurchaseOrder):
         - The calculated total price (product price plus applicable tax multiplied by the quantity).
     """
     # Locate the product in the fake inventory.
-    product = next((item for item in store_inventory if item.id == order.product_id), None)
+    product = _INVENTORY_BY_ID.get(order.product_id)
     if not product:
         raise HTTPException(status_code=404, detail=f"Product with ID {order.product_id} not found.")
 
     # Calculate the total cost for the order.
     total_price = (product.price * order.quantity) + ((product.tax or 0) * order.quantity)
 
-    order_confirmation = {
-        "message": f"Thank you {order.buyer_name} for your purchase!",
-        "product": product,
-        "quantity": order.quantity,
-        "total_price": total_price
-    }
-    return order_confirmation
+    order_confirmation = PurchaseConfirmation(
+        message=f"Thank you {order.buyer_name} for your purchase!",
+        product=product,
+        quantity=order.quantity,
+        total_price=total_price
+    )
+    # Serialize directly, leaving out a product's null description or tax, so the
+    # confirmation skips FastAPI's jsonable_encoder traversal.
+    return Response(
+        content=order_confirmation.model_dump_json(exclude_none=True),
+        media_type="application/json"
+    )
 
 # -----------------------------------------------------------------------------
 # Custom OpenAPI Schema Function with Server Information
@@ -180,9 +240,9 @@ async def purchase_item(order: PurchaseOrder):
 def custom_openapi():
     """
     Generate a custom OpenAPI schema with additional server information.
+
+    It is wrapped with functools.cache when assigned to app.openapi, so it only runs once.
     """
-    if app.openapi_schema:
-        return app.openapi_schema
     openapi_schema = get_openapi(
         title=app.title,
         version=app.version,
@@ -193,8 +253,7 @@ def custom_openapi():
     openapi_schema["servers"] = [
         {"url": "http://127.0.0.1:8000", "description": "Local development server"}
     ]
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    return openapi_schema
 
 # Override FastAPI's default OpenAPI schema generation.
-app.openapi = custom_openapi
+app.openapi = cache(custom_openapi)
@@ -0,0 +1,9 @@
+import argparse
+from pathlib import Path
+
+
+def parse_openapi_path(description: str) -> Path:
+    """Parse the OpenAPI file path from the command line."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("openapi_file", type=Path, help="Path to the OpenAPI file.")
+    return parser.parse_args().openapi_file
@@ -0,0 +1,32 @@
+import functools
+from pathlib import Path
+
+import msgspec
+import orjson
+import semantic_kernel as sk
+
+
+class OpenAPISpec(msgspec.Struct):
+    """Top-level fields an OpenAPI document must provide to be loaded as a plugin."""
+    openapi: str
+    info: dict
+    paths: dict
+    components: dict = msgspec.field(default_factory=dict)
+    servers: list = msgspec.field(default_factory=list)
+
+
+@functools.cache
+def load_openapi_spec(openapi_path: str) -> dict:
+    """Load and parse an OpenAPI document once per process."""
+    spec = orjson.loads(Path(openapi_path).read_bytes())
+    # Validate the top-level structure up front, so malformed documents fail before reaching the kernel.
+    msgspec.convert(spec, OpenAPISpec)
+    return spec
+
+
+def add_openapi_plugin(kernel: sk.Kernel, plugin_name: str, openapi_path: str):
+    """Add an OpenAPI plugin to the kernel from the cached parsed document."""
+    return kernel.add_plugin_from_openapi(
+        plugin_name=plugin_name,
+        openapi_parsed_spec=load_openapi_spec(openapi_path),
+    )
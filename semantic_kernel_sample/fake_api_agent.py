@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import semantic_kernel as sk
 
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
@@ -13,15 +14,16 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_
     AzureChatPromptExecutionSettings,
 )
 
+from _plugin_cache import add_openapi_plugin
+
 AZURE_OPENAI_DEPLOYMENT = "gpt-4o-2024-11-20"
 OPENAPI_FILE = "../sample_apis/fake_openapi.json"
 SERVICE_ID = "az_openai_chat_gpt4o"
 USER_INPUT = "I want to know which products are available in the store."
 
-async def main():
-    """Client"""
-    print("Starting agent")
-    
+@functools.cache
+def _get_kernel() -> sk.Kernel:
+    """Build the kernel with the AzOpenAI service and OpenAPI plugin once per process."""
     kernel = sk.Kernel()
     print("Kernel loaded")
 
@@ -34,7 +36,15 @@ async def main():
     kernel.add_service(chat_completion)
 
     print("Loading OpenAPI plugin to kernel")
-    openapi_plugin = kernel.add_plugin_from_openapi(plugin_name="openApiPlugin", openapi_document_path=OPENAPI_FILE)
+    add_openapi_plugin(kernel, "openApiPlugin", OPENAPI_FILE)
+    return kernel
+
+async def main():
+    """Client"""
+    print("Starting agent")
+    
+    kernel = _get_kernel()
+    chat_completion = kernel.get_service(SERVICE_ID)
 
 
     print("Create a chat history collection")
@@ -4,22 +4,18 @@ import logging
 
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
-# Get the OPEN_API_FILE path from command line
-import sys
-if len(sys.argv) > 1:
-    OPENAPI_FILE = sys.argv[1]
-else:
-    sys.exit("Please provide the path to the OpenAPI file as a command line argument.")
+from _cli import parse_openapi_path
+from _plugin_cache import add_openapi_plugin
 
 logger = logging.getLogger(__name__)
 
 
-async def main():
+async def main(openapi_path: str):
     """Client"""
     kernel = sk.Kernel()
     logging.info("Kernel loaded")
 
-    openapi_plugin = kernel.add_plugin_from_openapi(plugin_name="openApiPlugin", openapi_document_path=OPENAPI_FILE)
+    openapi_plugin = add_openapi_plugin(kernel, "openApiPlugin", openapi_path)
 
     # Simulate a user interaction
     # These are the methods you would collect through an agentic interaction with the user
@@ -28,10 +24,10 @@ async def main():
 
     # Posting to the API explicitly
     # This is where you would call the plugin method
-    result = await kernel.invoke(openapi_plugin["create_item_items__post"], arguments=kernel_arguments)
+    result = await kernel.invoke(openapi_plugin["create_item"], arguments=kernel_arguments)
 
     print(result)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(str(parse_openapi_path("Invoke an OpenAPI plugin function."))))
\ No newline at end of file
@@ -4,22 +4,18 @@ import logging
 
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
-# Get the OPEN_API_FILE path from command line
-import sys
-if len(sys.argv) > 1:
-    OPENAPI_FILE = sys.argv[1]
-else:
-    sys.exit("Please provide the path to the OpenAPI file as a command line argument.")
+from _cli import parse_openapi_path
+from _plugin_cache import add_openapi_plugin
 
 logger = logging.getLogger(__name__)
 
 
-async def main():
+async def main(openapi_path: str):
     """Client"""
     kernel = sk.Kernel()
     logging.info("Kernel loaded")
 
-    openapi_plugin = kernel.add_plugin_from_openapi(plugin_name="openApiPlugin", openapi_document_path=OPENAPI_FILE)
+    openapi_plugin = add_openapi_plugin(kernel, "openApiPlugin", openapi_path)
 
     for function in openapi_plugin.functions:
         print(f"Function: {function}")
@@ -27,4 +23,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(str(parse_openapi_path("List the functions of an OpenAPI plugin."))))
\ No newline at end of file
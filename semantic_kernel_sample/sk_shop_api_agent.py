@@ -1,4 +1,8 @@
 import asyncio
+import functools
+import sys
+import textwrap
+from typing import Final
 import semantic_kernel as sk
 
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
@@ -13,22 +17,27 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_
     AzureChatPromptExecutionSettings,
 )
 
+from _plugin_cache import add_openapi_plugin
+
 
 
 AZURE_OPENAI_DEPLOYMENT = "gpt-4o-2024-11-20"
 OPENAPI_FILE = "../sample_apis/shop_openapi.json"
 SERVICE_ID = "az_openai_chat_gpt4o"
 
-SYSTEM_MESSAGE = """
-You are a helpful assistant that can answer questions about the products available in the store.
-Limit yourself to questions related to the store.
-If the user asks about something else, please inform them that you can only answer questions related to the store.
-"""
-
-async def main():
-    """Client"""
-    print("Starting agent")
-    
+# The system message and the plugin's tool definitions, which are registered once and never
+# change, form the stable prefix of every request, so Azure OpenAI can serve it from the
+# prompt cache. Keep it byte-identical: never interpolate dynamic values into it.
+SYSTEM_MESSAGE: Final[str] = textwrap.dedent("""
+    You are a helpful assistant that can answer questions about the products available in the store.
+    Limit yourself to questions related to the store.
+    If the user asks about something else, please inform them that you can only answer questions related to the store.
+""").strip()
+PROMPT_CACHE_KEY: Final[str] = "shop_agent_v1"
+
+@functools.cache
+def _get_kernel() -> sk.Kernel:
+    """Build the kernel with the AzOpenAI service and OpenAPI plugin once per process."""
     kernel = sk.Kernel()
     print("Kernel loaded")
 
@@ -41,7 +50,15 @@ async def main():
     kernel.add_service(chat_completion)
 
     print("Loading OpenAPI plugin to kernel")
-    _ = kernel.add_plugin_from_openapi(plugin_name="openApiPlugin", openapi_document_path=OPENAPI_FILE)
+    add_openapi_plugin(kernel, "openApiPlugin", OPENAPI_FILE)
+    return kernel
+
+async def main():
+    """Client"""
+    print("Starting agent")
+    
+    kernel = _get_kernel()
+    chat_completion = kernel.get_service(SERVICE_ID)
 
     print("Create a chat history collection")
 
@@ -50,14 +67,19 @@ async def main():
     print("Enable planning")
     execution_settings = AzureChatPromptExecutionSettings()
     execution_settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
+    # Route requests sharing the fixed system message and tool prefix to the same prompt cache
+    execution_settings.extra_body = {"prompt_cache_key": PROMPT_CACHE_KEY}
 
-
-
+    # Read turns interactively from a terminal, or line by line from piped stdin for replays
+    if sys.stdin.isatty():
+        prompt = input
+    else:
+        prompt = lambda _: next(sys.stdin, "exit").rstrip("\n")
 
     # Start an interactive loop
     while True:
         # Get input from the user
-        user_input = input("User > ")
+        user_input = prompt("User > ")
         # Provide a mechanism to exit the loop
         if user_input.lower() in ["exit", "quit"]:
             print("Exiting chat...")